@@ -8,6 +8,7 @@ from werkzeug.utils import secure_filename
 from config import Config
 from database.db_operations import DBOperations
 from database.ai_integration import AIIntegration
+from database.sql_validator import SQLValidator
 
 app = Flask(__name__)
 app.config.from_object(Config)
@@ -149,12 +150,38 @@ def generate_sql():
         if table_name:
             schema = current_db.get_table_schema(table_name)
 
-        sql_query = ai_integration.generate_sql(prompt, schema)
+        validator = SQLValidator(
+            current_db,
+            large_table_rows=Config.AI_SQL_LARGE_TABLE_ROWS,
+            auto_limit=Config.AI_SQL_AUTO_LIMIT,
+        )
+        result = ai_integration.generate_validated_sql(
+            prompt, validator, schema, max_retries=Config.AI_SQL_MAX_RETRIES
+        )
 
-        if not sql_query:
+        if not result:
             return jsonify({"error": "Failed to generate SQL"}), 500
 
-        return jsonify({"success": True, "query": sql_query})
+        if not result["valid"]:
+            return (
+                jsonify(
+                    {
+                        "error": f"Generated SQL is invalid: {result['error']}",
+                        "query": result["query"],
+                    }
+                ),
+                422,
+            )
+
+        return jsonify(
+            {
+                "success": True,
+                "query": result["query"],
+                "plan": result["plan"],
+                "estimated_cost": result["estimated_cost"],
+                "warnings": result["warnings"],
+            }
+        )
     except Exception as e:
         logging.error(f"Error generating SQL: {e}")
         return jsonify({"error": str(e)}), 500
@@ -14,6 +14,11 @@ class Config:
     OLLAMA_BASE_URL = "http://localhost:11434"  # Default Ollama URL
     OLLAMA_MODEL = "llama2"  # Default model to use for SQL generation
 
+    # Validation of AI-generated SQL
+    AI_SQL_MAX_RETRIES = 2  # Re-prompts when generated SQL fails to prepare
+    AI_SQL_LARGE_TABLE_ROWS = 10000  # Flag full scans on tables at least this big
+    AI_SQL_AUTO_LIMIT = 1000  # LIMIT added to unbounded SELECTs (None to disable)
+
     @staticmethod
     def init_app(app):
         """Initialize the Flask application with configuration."""
@@ -1,6 +1,8 @@
 import logging
 import requests
-from typing import Optional
+from typing import Any, Dict, Optional
+
+from database.sql_validator import SQLValidator
 
 
 class AIIntegration:
@@ -19,18 +21,24 @@ class AIIntegration:
         self.base_url = base_url or "http://localhost:11434"
         self.model = model or "llama2"
 
-    def generate_sql(self, prompt: str, schema: Optional[str] = None) -> Optional[str]:
+    def generate_sql(
+        self,
+        prompt: str,
+        schema: Optional[str] = None,
+        feedback: Optional[str] = None,
+    ) -> Optional[str]:
         """
         Generate SQL from natural language using Ollama.
 
         Args:
             prompt (str): Natural language prompt describing the desired SQL
             schema (Optional[str]): Optional database schema to provide context
+            feedback (Optional[str]): Optional error from a previous attempt to correct
 
         Returns:
             Optional[str]: Generated SQL query or None if failed
         """
-        full_prompt = self._build_prompt(prompt, schema)
+        full_prompt = self._build_prompt(prompt, schema, feedback)
 
         try:
             response = requests.post(
@@ -59,7 +67,46 @@ class AIIntegration:
             logging.error(f"Request to Ollama failed: {e}")
             return None
 
-    def _build_prompt(self, prompt: str, schema: Optional[str]) -> str:
+    def generate_validated_sql(
+        self,
+        prompt: str,
+        validator: SQLValidator,
+        schema: Optional[str] = None,
+        max_retries: int = 2,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate SQL and validate it locally, re-prompting on errors.
+
+        Args:
+            prompt (str): Natural language prompt describing the desired SQL
+            validator (SQLValidator): Validator bound to the open database
+            schema (Optional[str]): Optional database schema to provide context
+            max_retries (int): Number of re-prompts after a query fails validation
+
+        Returns:
+            Optional[Dict[str, Any]]: Validation result of the last attempt
+            (see SQLValidator.validate) or None if generation failed
+        """
+        feedback = None
+        result = None
+
+        for _ in range(max_retries + 1):
+            sql_query = self.generate_sql(prompt, schema, feedback)
+            if not sql_query:
+                return result
+
+            result = validator.validate(sql_query)
+            if result["valid"]:
+                return result
+
+            logging.warning(f"Generated SQL failed validation: {result['error']}")
+            feedback = f"{sql_query}\n\nError: {result['error']}"
+
+        return result
+
+    def _build_prompt(
+        self, prompt: str, schema: Optional[str], feedback: Optional[str] = None
+    ) -> str:
         """
         Build the full prompt for SQL generation.
         """
@@ -68,6 +115,12 @@ class AIIntegration:
             "based on natural language descriptions. Always respond with only the SQL query, nothing else."
         )
 
+        if feedback:
+            system_message += (
+                "\n\nYour previous query was rejected by SQLite. "
+                f"Fix it and respond with the corrected query only.\n\n{feedback}"
+            )
+
         if schema:
             return (
                 f"{system_message}\n\n"
@@ -2,7 +2,8 @@ import csv
 import json
 import logging
 import sqlite3
-from typing import List, Dict, Any, Tuple
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 
 
 class DBOperations:
@@ -10,14 +11,16 @@ class DBOperations:
     Handles all SQLite database operations.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, read_only: bool = False):
         """
         Initialize with a database path.
 
         Args:
             db_path (str): Path to the SQLite database file
+            read_only (bool): Whether to open the database in read-only mode
         """
         self.db_path = db_path
+        self.read_only = read_only
         self.connection = None
         self.connect()
 
@@ -26,7 +29,11 @@ class DBOperations:
         Establish a connection to the database.
         """
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            if self.read_only:
+                uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+                self.connection = sqlite3.connect(uri, uri=True)
+            else:
+                self.connection = sqlite3.connect(self.db_path)
             self.connection.row_factory = sqlite3.Row  # Return rows as dictionaries
 
         except sqlite3.Error as e:
@@ -65,6 +72,102 @@ class DBOperations:
             logging.error(f"Query execution error: {e}")
             raise
 
+    def explain_query(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Prepare a SQL query with EXPLAIN without executing it.
+
+        Args:
+            query (str): SQL query to validate
+
+        Returns:
+            List[Dict[str, Any]]: Bytecode program with 'addr', 'opcode' and 'p1'-'p5' keys
+
+        Raises:
+            sqlite3.Error: If the query cannot be prepared against the database
+        """
+        cursor = self.connection.cursor()
+        cursor.execute(f"EXPLAIN {query}")
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_query_plan(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Get the EXPLAIN QUERY PLAN output for a SQL query.
+
+        Args:
+            query (str): SQL query to plan
+
+        Returns:
+            List[Dict[str, Any]]: Plan steps with 'id', 'parent' and 'detail' keys
+        """
+        cursor = self.connection.cursor()
+        cursor.execute(f"EXPLAIN QUERY PLAN {query}")
+        return [
+            {"id": row[0], "parent": row[1], "detail": row[3]}
+            for row in cursor.fetchall()
+        ]
+
+    def get_root_pages(self) -> Dict[Tuple[int, int], str]:
+        """
+        Map the b-tree root page of every table and index to its table name.
+
+        Returns:
+            Dict[Tuple[int, int], str]: Table names keyed by (database index, root page),
+            where the database index is the 'seq' column of PRAGMA database_list
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA database_list;")
+        databases = [(row["seq"], row["name"]) for row in cursor.fetchall()]
+
+        root_pages = {}
+        for seq, name in databases:
+            master = "sqlite_temp_master" if name == "temp" else "sqlite_master"
+            cursor.execute(
+                f'SELECT tbl_name, rootpage FROM "{name}".{master} WHERE rootpage > 0;'
+            )
+            for row in cursor.fetchall():
+                root_pages[(seq, row["rootpage"])] = row["tbl_name"]
+
+        return root_pages
+
+    def estimate_row_count(self, table_name: str, max_rows: Optional[int] = None) -> int:
+        """
+        Estimate the number of rows in a table without a full count.
+
+        Uses sqlite_stat1 when ANALYZE has been run, otherwise the highest rowid.
+        WITHOUT ROWID tables fall back to counting rows, stopping at max_rows.
+
+        Args:
+            table_name (str): Name of the table
+            max_rows (Optional[int]): Maximum number of rows to count in the fallback
+
+        Returns:
+            int: Estimated row count
+        """
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl=? LIMIT 1;",
+                (table_name,),
+            )
+            row = cursor.fetchone()
+            if row and row[0]:
+                return int(str(row[0]).split()[0])
+        except (sqlite3.Error, ValueError):
+            pass  # sqlite_stat1 only exists after ANALYZE
+
+        try:
+            cursor.execute(f'SELECT MAX(rowid) FROM "{table_name}";')
+            row = cursor.fetchone()
+            return int(row[0]) if row and row[0] is not None else 0
+        except sqlite3.Error:
+            pass  # WITHOUT ROWID tables have no rowid column
+
+        cursor.execute(
+            f'SELECT COUNT(*) FROM (SELECT 1 FROM "{table_name}" LIMIT ?);',
+            (max_rows if max_rows is not None else -1,),
+        )
+        return int(cursor.fetchone()[0])
+
     def get_tables(self) -> List[str]:
         """
         Get list of all tables in the database.
@@ -0,0 +1,321 @@
+import math
+import sqlite3
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from database.db_operations import DBOperations
+
+# Opcodes that rewind a cursor before looping over all of its entries
+SCAN_OPCODES = {"Rewind", "Last"}
+
+# Opcodes that close a loop by jumping back while a table cursor has more entries
+LOOP_OPCODES = {"Next", "Prev"}
+
+# Opcodes that close any loop, including loops over sorters and virtual tables
+ANY_LOOP_OPCODES = LOOP_OPCODES | {"SorterNext", "VNext"}
+
+# Opcodes that position a cursor through a key lookup
+SEARCH_OPCODES = {
+    "SeekRowid", "NotExists", "SeekGE", "SeekGT", "SeekLE", "SeekLT",
+    "NotFound", "Found", "NoConflict",
+}
+
+# Opcodes that remove every row of a b-tree, mapped to the operand holding the database index
+TRUNCATE_OPCODES = {"Clear": "p2", "Destroy": "p3"}
+
+
+class SQLValidator:
+    """
+    Validates SQL against an open database without executing it.
+    """
+
+    def __init__(
+        self,
+        db: DBOperations,
+        large_table_rows: int = 10000,
+        auto_limit: Optional[int] = None,
+    ):
+        """
+        Initialize the validator.
+
+        Args:
+            db (DBOperations): Database to prepare queries against
+            large_table_rows (int): Row count above which a full scan is flagged
+            auto_limit (Optional[int]): LIMIT to append to unbounded SELECTs, or None to disable
+        """
+        self.db = db
+        self.large_table_rows = large_table_rows
+        self.auto_limit = auto_limit
+
+    def validate(self, query: str) -> Dict[str, Any]:
+        """
+        Prepare a query with EXPLAIN and analyse its bytecode and query plan.
+
+        The query is prepared on a separate read-only connection that is closed
+        afterwards, since SQLite applies some PRAGMA statements while preparing them.
+
+        Args:
+            query (str): SQL query to validate
+
+        Returns:
+            Dict[str, Any]: Dictionary with 'valid', 'error', 'query', 'plan',
+            'estimated_cost' and 'warnings' keys. The cost is a rough number of
+            rows the query visits and does not take any LIMIT into account.
+        """
+        result = {
+            "valid": False,
+            "error": None,
+            "query": query,
+            "plan": [],
+            "estimated_cost": 0,
+            "warnings": [],
+        }
+
+        query = self._strip_trailing(query)
+        if not query:
+            result["error"] = "Empty query"
+            return result
+
+        db = DBOperations(self.db.db_path, read_only=True)
+        try:
+            try:
+                program = db.explain_query(query)
+            except (sqlite3.Error, sqlite3.Warning) as e:
+                result["error"] = str(e)
+                return result
+
+            root_pages = db.get_root_pages()
+            cursors = self._table_cursors(program, root_pages)
+
+            if self._is_write(program):
+                result["warnings"].append(
+                    "Query modifies the database and is not read-only"
+                )
+            else:
+                query, program = self._apply_limit(
+                    db, query, program, cursors, result["warnings"]
+                )
+                cursors = self._table_cursors(program, root_pages)
+
+            result["valid"] = True
+            result["query"] = query
+            result["plan"] = db.get_query_plan(query)
+            result["estimated_cost"] = self._estimate_cost(
+                db, program, root_pages, cursors, result["warnings"]
+            )
+            return result
+        finally:
+            db.close()
+
+    def _apply_limit(
+        self,
+        db: DBOperations,
+        query: str,
+        program: List[Dict[str, Any]],
+        cursors: Dict[int, str],
+        warnings: List[str],
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Append a LIMIT to read-only queries that loop over a table.
+
+        Queries that already have an outer LIMIT fail to prepare and are kept
+        as they are. The limited query is only kept if its bytecode loads the
+        limit value, which confirms the LIMIT was not swallowed by a comment.
+        """
+        if not self.auto_limit:
+            return query, program
+
+        has_table_loop = any(
+            op["opcode"] in LOOP_OPCODES and op["p1"] in cursors for op in program
+        )
+        if not has_table_loop or self._is_single_row_aggregate(program):
+            return query, program
+
+        limit = int(self.auto_limit)
+        limited = f"{query}\nLIMIT {limit}"
+        try:
+            limited_program = db.explain_query(limited)
+        except (sqlite3.Error, sqlite3.Warning):
+            return query, program  # Keep the original query if the LIMIT does not fit
+
+        if self._count_integer(limited_program, limit) <= self._count_integer(
+            program, limit
+        ):
+            return query, program
+
+        warnings.append(f"LIMIT {limit} was added to the query automatically")
+        return limited, limited_program
+
+    def _estimate_cost(
+        self,
+        db: DBOperations,
+        program: List[Dict[str, Any]],
+        root_pages: Dict[Tuple[int, int], str],
+        cursors: Dict[int, str],
+        warnings: List[str],
+    ) -> int:
+        """
+        Estimate the number of rows visited by a bytecode program.
+
+        Full scans and truncations cost the table's row count and key lookups
+        cost roughly log2 of it. Work inside a full-scan loop is multiplied by
+        that loop's row count, except for uncorrelated subqueries that only run
+        once; loops driven by a key lookup are assumed to match few rows. LIMIT
+        clauses are ignored. Full scans on large tables and
+        nested full scans are added to warnings.
+        """
+        row_counts: Dict[str, int] = {}
+        flagged: Set[str] = set()
+        cost = 0
+
+        def rows_for(table_name: str) -> int:
+            if table_name not in row_counts:
+                row_counts[table_name] = db.estimate_row_count(
+                    table_name, max_rows=self.large_table_rows
+                )
+            return row_counts[table_name]
+
+        # Body address ranges of full-scan loops with the table they iterate
+        loops: List[Tuple[int, int, str]] = []
+        for op in program:
+            if op["opcode"] not in LOOP_OPCODES or op["p1"] not in cursors:
+                continue
+            rewound = any(
+                prior["opcode"] in SCAN_OPCODES and prior["p1"] == op["p1"]
+                for prior in program[: op["p2"]]
+            )
+            if rewound:
+                loops.append((op["p2"], op["addr"], cursors[op["p1"]]))
+
+        # Uncorrelated subqueries are guarded by Once and only run the first time
+        once_blocks = [
+            (op["addr"], op["p2"]) for op in program if op["opcode"] == "Once"
+        ]
+
+        def outer_rows(addr: int) -> int:
+            rows = 1
+            for start, end, table_name in loops:
+                if not start <= addr <= end:
+                    continue
+                if any(
+                    start <= once_start <= addr < once_end
+                    for once_start, once_end in once_blocks
+                ):
+                    continue
+                rows *= max(rows_for(table_name), 1)
+            return rows
+
+        for op in program:
+            opcode = op["opcode"]
+
+            if opcode in TRUNCATE_OPCODES:
+                key = (op[TRUNCATE_OPCODES[opcode]], op["p1"])
+                if key in root_pages and root_pages[key] not in flagged:
+                    flagged.add(root_pages[key])
+                    cost += rows_for(root_pages[key])
+            elif opcode in SCAN_OPCODES and op["p1"] in cursors:
+                table_name = cursors[op["p1"]]
+                rows = rows_for(table_name)
+                outer = outer_rows(op["addr"])
+                cost += rows * outer
+                if rows >= self.large_table_rows and table_name not in flagged:
+                    warnings.append(
+                        f"Full scan on large table '{table_name}' "
+                        f"(~{rows} rows, before any LIMIT)"
+                    )
+                    flagged.add(table_name)
+                if outer > 1 and rows * outer >= self.large_table_rows:
+                    warnings.append(
+                        f"Full scan on '{table_name}' is nested inside another "
+                        f"loop (~{rows * outer} rows, before any LIMIT)"
+                    )
+            elif opcode in SEARCH_OPCODES and op["p1"] in cursors:
+                rows = rows_for(cursors[op["p1"]])
+                cost += (int(math.log2(rows + 1)) + 1) * outer_rows(op["addr"])
+
+        return cost
+
+    @staticmethod
+    def _table_cursors(
+        program: List[Dict[str, Any]], root_pages: Dict[Tuple[int, int], str]
+    ) -> Dict[int, str]:
+        """
+        Map the cursors a bytecode program opens on tables and indexes to table names.
+        """
+        cursors = {}
+        for op in program:
+            if op["opcode"] in ("OpenRead", "OpenWrite"):
+                key = (op["p3"], op["p2"])
+                if key in root_pages:
+                    cursors[op["p1"]] = root_pages[key]
+        return cursors
+
+    @staticmethod
+    def _is_write(program: List[Dict[str, Any]]) -> bool:
+        """
+        Check whether a bytecode program opens a write transaction.
+        """
+        return any(op["opcode"] == "Transaction" and op["p2"] for op in program)
+
+    @staticmethod
+    def _is_single_row_aggregate(program: List[Dict[str, Any]]) -> bool:
+        """
+        Check whether a bytecode program is an aggregate without GROUP BY.
+
+        Grouped aggregates compare each row against the current group key, and
+        a single-row aggregate emits its result outside of every loop.
+        """
+        opcodes = {op["opcode"] for op in program}
+        if "AggFinal" not in opcodes or "Compare" in opcodes:
+            return False
+
+        loops = [
+            (op["p2"], op["addr"])
+            for op in program
+            if op["opcode"] in ANY_LOOP_OPCODES
+        ]
+        return not any(
+            start <= op["addr"] <= end
+            for op in program
+            if op["opcode"] == "ResultRow"
+            for start, end in loops
+        )
+
+    @staticmethod
+    def _count_integer(program: List[Dict[str, Any]], value: int) -> int:
+        """
+        Count the opcodes that load a given integer constant.
+        """
+        return sum(
+            1 for op in program if op["opcode"] == "Integer" and op["p1"] == value
+        )
+
+    @staticmethod
+    def _strip_trailing(query: str) -> str:
+        """
+        Remove trailing whitespace, semicolons and comments from a query.
+        """
+        end = 0
+        i = 0
+        length = len(query)
+
+        while i < length:
+            char = query[i]
+            if query.startswith("--", i):
+                newline = query.find("\n", i)
+                i = length if newline == -1 else newline + 1
+                continue
+            if query.startswith("/*", i):
+                close = query.find("*/", i + 2)
+                i = length if close == -1 else close + 2
+                continue
+            if char in "'\"`[":
+                closing = "]" if char == "[" else char
+                close = query.find(closing, i + 1)
+                i = length if close == -1 else close + 1
+                end = i
+                continue
+            if not char.isspace() and char != ";":
+                end = i + 1
+            i += 1
+
+        return query[:end]
@@ -341,7 +341,7 @@ function generateSql() {
     })
         .then(response => response.json())
         .then(data => {
-            if (data.error) {
+            if (data.error && !data.query) {
                 alert(data.error);
                 return;
             }
@@ -350,9 +350,18 @@ function generateSql() {
             const modal = bootstrap.Modal.getInstance(document.getElementById('generateSqlModal'));
             modal.hide();
 
-            // Set the generated query
+            // Set the generated query (also when it was rejected, so it can be fixed by hand)
             document.getElementById('sqlQuery').value = data.query;
 
+            if (data.error) {
+                alert(data.error);
+            }
+
+            // Surface validation warnings (full scans, added LIMIT)
+            if (data.warnings && data.warnings.length) {
+                alert(`Generated SQL notes:\n- ${data.warnings.join('\n- ')}`);
+            }
+
             // Switch to query tab
             const queryTab = new bootstrap.Tab(document.getElementById('query-tab'));
             queryTab.show();
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from database.ai_integration import AIIntegration
+from database.db_operations import DBOperations
+from database.sql_validator import SQLValidator
+
+
+def ollama_response(text):
+    """Build a fake successful Ollama response."""
+    response = mock.Mock(status_code=200)
+    response.json.return_value = {"response": text}
+    return response
+
+
+class GenerateValidatedSQLTest(unittest.TestCase):
+    """
+    Tests for generating SQL and re-prompting on validation errors.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DBOperations(os.path.join(self.tmpdir.name, "test.db"))
+        self.db.execute_query("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);")
+        self.validator = SQLValidator(self.db)
+        self.ai = AIIntegration()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_reprompts_with_sqlite_error(self):
+        responses = [
+            ollama_response("SELECT * FRM users"),
+            ollama_response("```sql\nSELECT name FROM users\n```"),
+        ]
+        with mock.patch("requests.post", side_effect=responses) as post:
+            result = self.ai.generate_validated_sql("all names", self.validator)
+
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["query"], "SELECT name FROM users")
+        self.assertEqual(post.call_count, 2)
+
+        first_prompt = post.call_args_list[0].kwargs["json"]["prompt"]
+        second_prompt = post.call_args_list[1].kwargs["json"]["prompt"]
+        self.assertNotIn("syntax error", first_prompt)
+        self.assertIn("SELECT * FRM users", second_prompt)
+        self.assertIn('near "FRM": syntax error', second_prompt)
+
+    def test_stops_after_max_retries(self):
+        with mock.patch.object(
+            self.ai, "generate_sql", return_value="SELECT * FROM missing"
+        ) as generate:
+            result = self.ai.generate_validated_sql(
+                "anything", self.validator, max_retries=2
+            )
+
+        self.assertEqual(generate.call_count, 3)
+        self.assertFalse(result["valid"])
+        self.assertIn("no such table", result["error"])
+
+    def test_returns_last_invalid_result_when_generation_fails(self):
+        with mock.patch.object(
+            self.ai, "generate_sql", side_effect=["SELECT * FROM missing", None]
+        ) as generate:
+            result = self.ai.generate_validated_sql("anything", self.validator)
+
+        self.assertEqual(generate.call_count, 2)
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["query"], "SELECT * FROM missing")
+
+    def test_returns_none_when_first_generation_fails(self):
+        with mock.patch.object(self.ai, "generate_sql", return_value=None):
+            self.assertIsNone(
+                self.ai.generate_validated_sql("anything", self.validator)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import app as app_module
+from database.db_operations import DBOperations
+
+
+class GenerateSQLRouteTest(unittest.TestCase):
+    """
+    Tests for the /generate_sql route.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DBOperations(os.path.join(self.tmpdir.name, "test.db"))
+        self.db.execute_query("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);")
+
+        db_patch = mock.patch.object(app_module, "current_db", self.db)
+        db_patch.start()
+        self.addCleanup(db_patch.stop)
+
+        self.client = app_module.app.test_client()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_invalid_sql_returns_422_with_query(self):
+        with mock.patch.object(
+            app_module.ai_integration, "generate_sql", return_value="SELECT * FROM missing"
+        ):
+            response = self.client.post("/generate_sql", data={"prompt": "anything"})
+
+        self.assertEqual(response.status_code, 422)
+        payload = response.get_json()
+        self.assertEqual(payload["query"], "SELECT * FROM missing")
+        self.assertIn("no such table", payload["error"])
+
+    def test_valid_sql_returns_plan_and_warnings(self):
+        with mock.patch.object(
+            app_module.ai_integration, "generate_sql", return_value="SELECT * FROM users"
+        ):
+            response = self.client.post("/generate_sql", data={"prompt": "all users"})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.assertTrue(payload["success"])
+        self.assertTrue(payload["query"].startswith("SELECT * FROM users"))
+        self.assertIn("plan", payload)
+        self.assertIn("estimated_cost", payload)
+        self.assertIsInstance(payload["warnings"], list)
+
+
+if __name__ == "__main__":
+    unittest.main()
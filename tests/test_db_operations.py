@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from database.db_operations import DBOperations
+
+
+class DBOperationsTest(unittest.TestCase):
+    """
+    Tests for the query inspection helpers of DBOperations.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "test.db")
+        self.db = DBOperations(self.db_path)
+        self.db.connection.executescript(
+            """
+            CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE tags (name TEXT PRIMARY KEY) WITHOUT ROWID;
+            """
+        )
+        self.db.connection.executemany(
+            "INSERT INTO tags VALUES (?);", [(f"tag{i}",) for i in range(50)]
+        )
+        self.db.connection.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_estimate_row_count_without_rowid(self):
+        self.assertEqual(self.db.estimate_row_count("tags"), 50)
+        self.assertEqual(self.db.estimate_row_count("tags", max_rows=10), 10)
+
+    def test_get_root_pages_keys_on_database_index(self):
+        other_path = os.path.join(self.tmpdir.name, "other.db")
+        other = DBOperations(other_path)
+        other.execute_query("CREATE TABLE archive (id INTEGER PRIMARY KEY);")
+        other.close()
+        self.db.connection.execute("ATTACH DATABASE ? AS other;", (other_path,))
+
+        root_pages = self.db.get_root_pages()
+        archive_root = [key for key, name in root_pages.items() if name == "archive"]
+
+        self.assertEqual(len(archive_root), 1)
+        self.assertNotEqual(archive_root[0][0], 0)
+        self.assertEqual(root_pages[(0, archive_root[0][1])], "users")
+
+    def test_read_only_connection(self):
+        read_only = DBOperations(self.db_path, read_only=True)
+        try:
+            with self.assertRaises(Exception):
+                read_only.insert_row("users", {"name": "blocked"})
+        finally:
+            read_only.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+import os
+import tempfile
+import unittest
+
+from database.db_operations import DBOperations
+from database.sql_validator import SQLValidator
+
+
+class SQLValidatorTest(unittest.TestCase):
+    """
+    Tests for validating SQL against a temporary database.
+    """
+
+    ROWS = 2000
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DBOperations(os.path.join(self.tmpdir.name, "test.db"))
+        self.db.connection.executescript(
+            """
+            CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, total REAL);
+            """
+        )
+        self.db.connection.executemany(
+            "INSERT INTO users (name) VALUES (?);",
+            [(f"user{i}",) for i in range(self.ROWS)],
+        )
+        self.db.connection.executemany(
+            "INSERT INTO orders (user_id, total) VALUES (?, ?);",
+            [(i, i * 1.5) for i in range(self.ROWS)],
+        )
+        self.db.connection.commit()
+        self.validator = SQLValidator(self.db, large_table_rows=1000, auto_limit=100)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def assertLimited(self, result):
+        self.assertTrue(result["valid"])
+        self.assertIn("LIMIT 100 was added to the query automatically", result["warnings"])
+        rows = self.db.connection.execute(result["query"]).fetchall()
+        self.assertEqual(len(rows), 100)
+
+    def test_valid_query(self):
+        result = self.validator.validate("SELECT name FROM users WHERE id = 5")
+        self.assertTrue(result["valid"])
+        self.assertIsNone(result["error"])
+        self.assertTrue(result["plan"])
+        self.assertLess(result["estimated_cost"], self.ROWS)
+
+    def test_invalid_query(self):
+        result = self.validator.validate("SELEC * FROM users")
+        self.assertFalse(result["valid"])
+        self.assertIn("syntax error", result["error"])
+
+        result = self.validator.validate("SELECT * FROM missing")
+        self.assertFalse(result["valid"])
+        self.assertIn("no such table", result["error"])
+
+    def test_multiple_statements_rejected(self):
+        result = self.validator.validate("SELECT 1; SELECT 2")
+        self.assertFalse(result["valid"])
+
+    def test_auto_limit(self):
+        self.assertLimited(self.validator.validate("SELECT * FROM users;"))
+
+    def test_auto_limit_after_trailing_comments(self):
+        self.assertLimited(self.validator.validate("SELECT * FROM users -- everything"))
+        self.assertLimited(self.validator.validate("SELECT * FROM users; -- c"))
+        self.assertLimited(self.validator.validate("SELECT * FROM users /* all */"))
+
+    def test_comment_markers_in_strings_are_kept(self):
+        result = self.validator.validate("SELECT '--', '/*' FROM users")
+        self.assertLimited(result)
+        self.assertEqual(result["query"], "SELECT '--', '/*' FROM users\nLIMIT 100")
+
+    def test_existing_limit_is_kept(self):
+        result = self.validator.validate("SELECT * FROM users LIMIT 5")
+        self.assertEqual(result["query"], "SELECT * FROM users LIMIT 5")
+        self.assertNotIn(
+            "LIMIT 100 was added to the query automatically", result["warnings"]
+        )
+
+    def test_full_scan_warning(self):
+        result = self.validator.validate("SELECT * FROM users")
+        self.assertEqual(result["estimated_cost"], self.ROWS)
+        self.assertTrue(any("'users'" in w for w in result["warnings"]))
+
+    def test_join_aliases(self):
+        result = self.validator.validate(
+            "SELECT * FROM users u JOIN orders o ON u.id = o.user_id"
+        )
+        self.assertGreaterEqual(result["estimated_cost"], self.ROWS)
+        self.assertTrue(any("Full scan" in w for w in result["warnings"]))
+
+    def test_comma_join_aliases(self):
+        result = self.validator.validate(
+            "SELECT * FROM users u, orders o WHERE u.id = o.user_id"
+        )
+        self.assertGreaterEqual(result["estimated_cost"], self.ROWS)
+        self.assertTrue(any("'orders'" in w for w in result["warnings"]))
+
+    def test_dml_is_flagged_and_not_executed(self):
+        result = self.validator.validate("DELETE FROM users")
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["query"], "DELETE FROM users")
+        self.assertEqual(result["estimated_cost"], self.ROWS)
+        self.assertIn(
+            "Query modifies the database and is not read-only", result["warnings"]
+        )
+        self.assertEqual(
+            self.db.execute_query("SELECT COUNT(*) AS n FROM users")[0]["n"], self.ROWS
+        )
+
+    def test_update_with_condition_is_flagged(self):
+        result = self.validator.validate("UPDATE orders SET total = 0 WHERE total > 5")
+        self.assertTrue(result["valid"])
+        self.assertIn(
+            "Query modifies the database and is not read-only", result["warnings"]
+        )
+        self.assertGreaterEqual(result["estimated_cost"], self.ROWS)
+
+    def test_pragma_does_not_change_app_connection(self):
+        for query in (
+            "PRAGMA query_only = 1",
+            "PRAGMA foreign_keys = 1",
+            "PRAGMA cache_size = 123",
+        ):
+            self.validator.validate(query)
+
+        connection = self.db.connection
+        self.assertEqual(connection.execute("PRAGMA query_only;").fetchone()[0], 0)
+        self.assertEqual(connection.execute("PRAGMA foreign_keys;").fetchone()[0], 0)
+        self.assertNotEqual(connection.execute("PRAGMA cache_size;").fetchone()[0], 123)
+        self.db.insert_row("users", {"name": "still writable"})
+
+    def test_cross_join_cost(self):
+        result = self.validator.validate("SELECT * FROM users, orders")
+        self.assertGreaterEqual(result["estimated_cost"], self.ROWS * self.ROWS)
+        self.assertTrue(any("nested" in w for w in result["warnings"]))
+
+    def test_uncorrelated_subquery_is_not_multiplied(self):
+        result = self.validator.validate(
+            "SELECT * FROM users WHERE id IN (SELECT user_id FROM orders LIMIT 5)"
+        )
+        self.assertLess(result["estimated_cost"], self.ROWS * 3)
+        self.assertFalse(any("nested" in w for w in result["warnings"]))
+
+    def test_without_rowid_table(self):
+        self.db.connection.execute(
+            "CREATE TABLE tags (name TEXT PRIMARY KEY, hits INTEGER) WITHOUT ROWID;"
+        )
+        self.db.connection.executemany(
+            "INSERT INTO tags VALUES (?, ?);",
+            [(f"tag{i}", i) for i in range(self.ROWS)],
+        )
+        self.db.connection.commit()
+
+        result = self.validator.validate("SELECT * FROM tags")
+        self.assertGreaterEqual(result["estimated_cost"], 1000)
+        self.assertTrue(any("'tags'" in w for w in result["warnings"]))
+
+    def test_auto_limit_with_limit_in_subquery(self):
+        self.assertLimited(
+            self.validator.validate(
+                "SELECT * FROM users WHERE id IN (SELECT user_id FROM orders LIMIT 500)"
+            )
+        )
+
+    def test_auto_limit_with_limit_in_names(self):
+        self.assertLimited(
+            self.validator.validate('SELECT name AS "limit", \'limit\' FROM users')
+        )
+
+    def test_auto_limit_after_leading_comment(self):
+        self.assertLimited(self.validator.validate("-- get rows\nSELECT * FROM users"))
+
+    def test_single_row_aggregates(self):
+        for query in ("SELECT count(*) FROM users", "SELECT sum(total) FROM orders"):
+            result = self.validator.validate(query)
+            self.assertEqual(result["query"], query)
+            self.assertNotIn(
+                "LIMIT 100 was added to the query automatically", result["warnings"]
+            )
+
+        result = self.validator.validate("SELECT count(*) FROM users")
+        self.assertEqual(result["warnings"], [])
+
+    def test_grouped_aggregate_is_limited(self):
+        self.assertLimited(
+            self.validator.validate("SELECT name, count(*) FROM users GROUP BY name")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()